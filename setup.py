@@ -6,8 +6,10 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     install_requires=[
-        "pydantic>=2.6.1",
+        "msgspec>=0.18.0",
         "python-dateutil>=2.8.2",
+        "orjson>=3.8.0",
+        "cysimdjson>=23.8",
     ],
     python_requires=">=3.12",
 ) 
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+import msgspec
 
-class MatchInfo(BaseModel):
+class MatchInfo(msgspec.Struct):
     """
     Model for match-level information.
     Fields:
@@ -10,13 +10,13 @@ class MatchInfo(BaseModel):
         venue: Venue of the match
         city: City where the match was played
         teams: List of team names
+        gender: Gender category of the match (men/women)
         winner: Winning team name
         win_margin: Margin of victory
         win_margin_type: Type of margin (runs/wickets)
         toss_winner: Team that won the toss
         toss_decision: Toss decision (bat/field)
         balls_per_over: Number of balls per over (default 6)
-        gender: Gender category of the match (men/women)
         event: Event information (tournament, series, etc.)
     """
     match_date: str
@@ -24,16 +24,16 @@ class MatchInfo(BaseModel):
     venue: str
     city: str
     teams: List[str]
+    gender: str
     winner: Optional[str] = None
     win_margin: Optional[int] = None
     win_margin_type: Optional[str] = None
     toss_winner: Optional[str] = None
     toss_decision: Optional[str] = None
     balls_per_over: int = 6
-    gender: str
-    event: Dict[str, Any] = Field(default_factory=dict)
+    event: Dict[str, Any] = msgspec.field(default_factory=dict)
 
-class DeliveryInfo(BaseModel):
+class DeliveryInfo(msgspec.Struct):
     """
     Model for delivery-level (ball-by-ball) information.
     Fields:
@@ -67,4 +67,4 @@ class DeliveryInfo(BaseModel):
     extras_type: Optional[str] = None
     wicket_type: Optional[str] = None
     wicket_player_out: Optional[str] = None
-    wicket_fielders: List[str] = Field(default_factory=list) 
\ No newline at end of file
+    wicket_fielders: List[str] = msgspec.field(default_factory=list)
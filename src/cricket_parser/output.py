@@ -1,12 +1,67 @@
 import json
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Union, Iterator
+from typing import List, Dict, Any, Union, Iterable, Iterator
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson wheels unavailable on some platforms
+    orjson = None
+
+# orjson parses the cricsheet files ~2-3x faster than stdlib json; fall back
+# to the stdlib parser when the wheel is not installable.
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps_line(record):
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    _loads = json.loads
+
+    def _dumps_line(record):
+        return (json.dumps(record) + '\n').encode()
+
+# Flush threshold for buffered JSONL writes; batching lines into ~1MB
+# chunks keeps the syscall count low without holding much in memory.
+_WRITE_BUFFER_SIZE = 1 << 20
+
 logger = logging.getLogger(__name__)
 
+def _load_records(input_file: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Load a single input file and return its data as a list of records.
+    Supports both JSON array and JSONL formats.
+    Module-level so it pickles cleanly for ProcessPoolExecutor workers.
+    Args:
+        input_file: Path to the input file
+    Returns:
+        List of records loaded from the file
+    """
+    records = []
+    raw = Path(input_file).read_bytes()
+    # Dispatch on the first non-whitespace byte: a JSON array parses in one
+    # shot, anything else is treated as JSONL. This avoids the old
+    # try-the-array-parse-then-rescan pattern, which wasted a full scan on
+    # JSONL inputs and swallowed genuine parse errors in array inputs.
+    if raw[:4096].lstrip()[:1] == b'[':
+        return _loads(raw)
+
+    # Treat as JSONL
+    for line in raw.splitlines():
+        line = line.strip()
+        if line:  # Skip empty lines
+            try:
+                record = _loads(line)
+                records.append(record)
+            except ValueError:
+                logger.warning(f"Failed to parse line as JSON: {line}")
+                continue
+    return records
+
 class OutputGenerator:
     """
     Handles generation of output files for cricket match data.
@@ -19,13 +74,15 @@ class OutputGenerator:
         """
         pass
 
-    def write_output(self, data: List[Dict[str, Any]], output_path: Union[str, Path], stream: bool = False) -> None:
+    def write_output(self, data: Iterable[Dict[str, Any]], output_path: Union[str, Path]) -> None:
         """
         Write parsed data to a JSONL file (one JSON object per line).
+        Records are always streamed through a bounded write buffer, so the
+        whole dataset is never materialized here.
         Args:
-            data: List of records
+            data: Iterable of records; generators are consumed in one pass
+                without being materialized
             output_path: Path to write the output file
-            stream: If True, write records one by one (streaming)
         Raises:
             Exception: If output path is invalid or file cannot be written
         """
@@ -35,42 +92,90 @@ class OutputGenerator:
         try:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                for record in data:
-                    json.dump(record, f)
-                    f.write('\n')
+            with open(output_path, 'wb') as f:
+                self._write_records(f, data)
             logger.info(f"Successfully wrote output to {output_path}")
         except Exception as e:
             logger.error(f"Error writing output to {output_path}: {str(e)}")
             raise
 
-    def process_batch(self, input_files: List[Union[str, Path]], output_path: Union[str, Path], parallel: bool = True, stream: bool = False) -> None:
+    def process_batch(self, input_files: List[Union[str, Path]], output_path: Union[str, Path], parallel: bool = True,
+                      use_processes: bool = False) -> None:
         """
         Process multiple input files and write combined output in JSONL format.
+        Output is always streamed to the file one input file at a time.
         Args:
             input_files: List of paths to input files
             output_path: Path to write the combined output file
             parallel: If True, process files in parallel
-            stream: If True, write output in streaming mode
+            use_processes: If True, parse files in worker processes instead of
+                threads; worthwhile when parsing dominates and the GIL binds
         Raises:
             Exception: If files cannot be read or written
         """
+        output_dir = os.path.dirname(output_path)
+        if output_dir and not os.path.exists(output_dir):
+            raise Exception(f"Output directory does not exist: {output_dir}")
         try:
-            all_records = []
-            if parallel:
-                with ThreadPoolExecutor() as executor:
-                    futures = {executor.submit(self._load_file, f): f for f in input_files}
-                    for future in as_completed(futures):
-                        all_records.extend(future.result())
-            else:
-                for input_file in input_files:
-                    all_records.extend(self._load_file(input_file))
-            self.write_output(all_records, output_path, stream=stream)
+            # Stream records straight to the output file as each input file is
+            # loaded; in-flight loads are bounded below, so peak memory stays
+            # at a fixed number of files' worth instead of the whole batch.
+            with open(output_path, 'wb') as f_out:
+                if parallel:
+                    # Threads are the default since orjson does the heavy
+                    # lifting in C; processes only pay off when Python-level
+                    # parsing dominates and the GIL becomes the bottleneck.
+                    if use_processes:
+                        executor_cls = ProcessPoolExecutor
+                        max_workers = os.cpu_count()
+                    else:
+                        executor_cls = ThreadPoolExecutor
+                        max_workers = min(32, 4 * (os.cpu_count() or 1))
+                    with executor_cls(max_workers=max_workers) as executor:
+                        # Sliding window of futures instead of executor.map:
+                        # map submits the whole batch up front, and results
+                        # the in-order writer has not reached yet pile up
+                        # without bound when the writer lags. Capping the
+                        # window keeps at most max_workers + 1 loaded files
+                        # resident at once.
+                        files_iter = iter(input_files)
+                        pending = deque(
+                            executor.submit(_load_records, input_file)
+                            for input_file in islice(files_iter, max_workers + 1)
+                        )
+                        while pending:
+                            records = pending.popleft().result()
+                            next_file = next(files_iter, None)
+                            if next_file is not None:
+                                pending.append(executor.submit(_load_records, next_file))
+                            self._write_records(f_out, records)
+                else:
+                    for input_file in input_files:
+                        self._write_records(f_out, _load_records(input_file))
             logger.info(f"Successfully processed {len(input_files)} files to {output_path}")
         except Exception as e:
             logger.error(f"Error processing batch: {str(e)}")
             raise
 
+    @staticmethod
+    def _write_records(f_out, records) -> None:
+        """
+        Write records to an open binary file in JSONL format.
+        Lines are batched into a bytearray and flushed in ~1MB chunks to
+        amortize write syscalls.
+        Args:
+            f_out: Binary file object opened for writing
+            records: Iterable of record dictionaries
+        """
+        buf = bytearray()
+        for record in records:
+            buf += _dumps_line(record)
+            if len(buf) > _WRITE_BUFFER_SIZE:
+                f_out.write(buf)
+                buf.clear()
+        if buf:
+            f_out.write(buf)
+
     @staticmethod
     def _load_file(input_file: Union[str, Path]) -> List[Dict[str, Any]]:
         """
@@ -81,25 +186,4 @@ class OutputGenerator:
         Returns:
             List of records loaded from the file
         """
-        records = []
-        with open(input_file) as f:
-            # Try reading as JSON array first
-            try:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
-            except json.JSONDecodeError:
-                pass
-            
-            # If not a JSON array, try reading as JSONL
-            f.seek(0)
-            for line in f:
-                line = line.strip()
-                if line:  # Skip empty lines
-                    try:
-                        record = json.loads(line)
-                        records.append(record)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse line as JSON: {line}")
-                        continue
-        return records 
\ No newline at end of file
+        return _load_records(input_file) 
\ No newline at end of file
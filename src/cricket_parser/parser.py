@@ -1,11 +1,54 @@
 from pathlib import Path
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+import itertools
 import json
-from typing import Dict, Any, List, Optional, Union
-from pydantic import BaseModel, Field
-from .models import MatchInfo, DeliveryInfo
+import msgspec
+import operator
+import os
+import sys
+from typing import Dict, Any, Iterator, List, Optional, Union
+from .models import MatchInfo
 from .transformer import CricketDataTransformer
 from .output import OutputGenerator
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson wheels unavailable on some platforms
+    orjson = None
+
+try:
+    import cysimdjson
+except ImportError:  # pragma: no cover - cysimdjson wheels unavailable on some platforms
+    cysimdjson = None
+
+# orjson parses the cricsheet files ~2-3x faster than stdlib json; fall back
+# to the stdlib parser when the wheel is not installable.
+_loads = orjson.loads if orjson is not None else json.loads
+
+# C-level multi-fetch for the per-delivery subscripts; cheaper than
+# sequential Python-level lookups in the hot loop.
+_get_delivery_fields = operator.itemgetter("batter", "non_striker", "bowler")
+_get_runs_fields = operator.itemgetter("batter", "extras", "total")
+
+# One parser per worker process, created lazily on first use so the
+# simdjson instance is never shared across processes.
+_worker_parser = None
+
+def _parse_file_worker(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Parse a single match file inside a worker process.
+    Module-level so it pickles cleanly for ProcessPoolExecutor.
+    Args:
+        file_path: Path to the JSON file containing match data
+    Returns:
+        List of dictionaries containing parsed delivery data
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = CricketParser()
+    return _worker_parser.parse_file(file_path)
+
 class CricketParser:
     """
     Parser for cricket match data from cricsheet.org JSON format.
@@ -18,6 +61,9 @@ class CricketParser:
         """
         self.transformer = CricketDataTransformer()
         self.output_generator = OutputGenerator()
+        # Reused across parse_file calls; each parse invalidates the previous
+        # document, which is fine because _parse_data consumes it eagerly.
+        self._simd = cysimdjson.JSONParser() if cysimdjson is not None else None
 
     def parse_file(self, file_path: str | Path) -> List[Dict[str, Any]]:
         """
@@ -27,22 +73,47 @@ class CricketParser:
         Returns:
             List of dictionaries containing parsed delivery data
         """
-        with open(file_path) as f:
-            data = json.load(f)
-        return self._parse_data(data)
+        return list(self._iter_file(file_path))
+
+    def _iter_file(self, file_path: str | Path) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parse a single cricket match file, yielding one record per
+        delivery. The document must be consumed before the next file is
+        parsed, since the simdjson parser instance is reused.
+        Args:
+            file_path: Path to the JSON file containing match data
+        Yields:
+            Dictionaries containing parsed delivery data
+        """
+        raw = Path(file_path).read_bytes()
+        if self._simd is not None:
+            # simdjson only materializes the elements _iter_data actually
+            # touches, skipping dict construction for the fields we never read.
+            yield from self._iter_data(self._simd.parse(raw))
+        else:
+            yield from self._iter_data(_loads(raw))
 
-    def parse_directory(self, directory_path: str | Path) -> List[Dict[str, Any]]:
+    def parse_directory(self, directory_path: str | Path, parallel: bool = True) -> List[Dict[str, Any]]:
         """
         Parse all cricket match files in a directory.
         Args:
             directory_path: Path to directory containing match files
+            parallel: If True, parse files across worker processes; matches
+                are independent, so the work scales with physical cores
         Returns:
             List of dictionaries containing parsed delivery data from all matches
         """
-        results = []
-        for file_path in Path(directory_path).glob("*.json"):
-            results.extend(self.parse_file(file_path))
-        return results
+        # os.scandir is cheaper than Path.glob on large cricsheet corpora:
+        # one Path object per match file adds up over tens of thousands.
+        with os.scandir(directory_path) as it:
+            files = [entry.path for entry in it
+                     if entry.is_file(follow_symlinks=False) and entry.name.endswith(".json")]
+        files.sort()
+        if parallel and len(files) > 1:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                return list(itertools.chain.from_iterable(
+                    executor.map(_parse_file_worker, files, chunksize=16)))
+        return list(itertools.chain.from_iterable(map(self.parse_file, files)))
 
     def _parse_data(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -52,13 +123,34 @@ class CricketParser:
         Returns:
             List of dictionaries containing parsed delivery data
         """
-        # Extract match information
-        match_info = self._extract_match_info(data["info"])
+        return list(self._iter_data(data))
+
+    def _iter_data(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parse the cricket match data, yielding one record per delivery.
+        Streaming consumers (e.g. JSONL writers) can iterate this directly
+        without materializing the whole match in memory.
+        Args:
+            data: Dictionary containing match data
+        Yields:
+            Dictionaries containing parsed delivery data
+        """
+        # Extract match information. The info section is small and read in
+        # full, so export lazy simdjson elements to a plain dict up front.
+        info = data["info"]
+        if hasattr(info, "export"):
+            info = info.export()
+        match_info = self._extract_match_info(info)
+        # Dump match info once; it is invariant across every delivery.
+        match_dict = msgspec.structs.asdict(match_info)
+        match_dict.pop('balls_per_over', None)
+        # Hoist the per-match invariants into locals so the innings/over
+        # loops avoid repeated attribute access on match_info.
+        teams = tuple(match_info.teams)
+        balls_per_over = match_info.balls_per_over
         # Process innings
-        results = []
         for innings_number, innings in enumerate(data["innings"], 1):
-            results.extend(self._process_innings(innings, innings_number, match_info))
-        return results
+            yield from self._process_innings(innings, innings_number, teams, balls_per_over, match_dict)
 
     def _extract_match_info(self, info: Dict[str, Any]) -> MatchInfo:
         """
@@ -99,12 +191,14 @@ class CricketParser:
         # Extract event information
         event = info.get("event", {})
         
+        # Intern the strings repeated into every delivery record so the
+        # hundreds of records per match share one object per value.
         return MatchInfo(
             match_date=info["dates"][0],
             match_type=info["match_type"],
-            venue=info["venue"],
-            city=info["city"],
-            teams=info["teams"],
+            venue=sys.intern(info["venue"]),
+            city=sys.intern(info["city"]),
+            teams=[sys.intern(team) for team in info["teams"]],
             winner=winner,
             win_margin=win_margin,
             win_margin_type=win_margin_type,
@@ -115,84 +209,82 @@ class CricketParser:
             event=event
         )
 
-    def _process_innings(self, innings: Dict[str, Any], innings_number: int, match_info: MatchInfo) -> List[Dict[str, Any]]:
+    def _process_innings(self, innings: Dict[str, Any], innings_number: int, teams: tuple,
+                        balls_per_over: int, match_dict: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
         Process a single innings.
         Args:
             innings: Dictionary containing innings data
             innings_number: Number of the innings (1 or 2)
-            match_info: MatchInfo object containing match information
-        Returns:
-            List of dictionaries containing parsed delivery data
+            teams: Tuple of the two team names
+            balls_per_over: Number of legal deliveries per over
+            match_dict: Match information pre-dumped to a dict
+        Yields:
+            Dictionaries containing parsed delivery data
         """
-        results = []
-        batting_team = innings["team"]
-        bowling_team = next(team for team in match_info.teams if team != batting_team)
+        batting_team = sys.intern(innings["team"])
+        bowling_team = next(team for team in teams if team != batting_team)
+        sides = (batting_team, bowling_team)
         for over in innings["overs"]:
-            results.extend(self._process_over(over, innings_number, batting_team, bowling_team, match_info))
-        return results
+            yield from self._process_over(over, innings_number, sides, balls_per_over, match_dict)
 
-    def _process_over(self, over: Dict[str, Any], innings_number: int, batting_team: str, 
-                     bowling_team: str, match_info: MatchInfo) -> List[Dict[str, Any]]:
+    def _process_over(self, over: Dict[str, Any], innings_number: int, sides: tuple,
+                     balls_per_over: int, match_dict: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
         Process a single over.
         Args:
             over: Dictionary containing over data
             innings_number: Number of the innings
-            batting_team: Team batting in this innings
-            bowling_team: Team bowling in this innings
-            match_info: MatchInfo object containing match information
-        Returns:
-            List of dictionaries containing parsed delivery data
+            sides: (batting_team, bowling_team) tuple for this innings
+            balls_per_over: Number of legal deliveries per over
+            match_dict: Match information pre-dumped to a dict
+        Yields:
+            Dictionaries containing parsed delivery data
         """
-        results = []
         over_number = over["over"]
-        balls_per_over = match_info.balls_per_over
         ball_number = 1
         legal_deliveries_count = 0
         for delivery in over["deliveries"]:
+            # Probe the extras dict once and reuse it for both the legality
+            # check here and the extras_type extraction downstream.
+            extras = delivery.get("extras")
             # Check if this delivery is a legal ball (not a wide or no-ball)
-            is_legal = True
-            if "extras" in delivery:
-                extras = delivery["extras"]
-                if "wides" in extras or "noball" in extras:
-                    is_legal = False
-            delivery_info = self._process_delivery(
-                delivery, over_number, ball_number, innings_number,
-                batting_team, bowling_team
+            is_legal = not (extras and ("wides" in extras or "noball" in extras))
+            yield self._process_delivery_dict(
+                delivery, over_number, ball_number, innings_number, sides, match_dict, extras
             )
-            results.append(self.transformer.transform_record(match_info, delivery_info))
             if is_legal:
                 legal_deliveries_count += 1
                 ball_number += 1
         # No error raised for more than balls_per_over total deliveries, only for legal deliveries
         if legal_deliveries_count > balls_per_over:
             raise ValueError(f"Over {over_number} has more than {balls_per_over} legal deliveries.")
-        return results
 
-    def _process_delivery(self, delivery: Dict[str, Any], over_number: int, ball_number: int,
-                         innings_number: int, batting_team: str, bowling_team: str) -> DeliveryInfo:
+    def _process_delivery_dict(self, delivery: Dict[str, Any], over_number: int, ball_number: int,
+                              innings_number: int, sides: tuple, match_dict: Dict[str, Any],
+                              extras: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Process a single delivery.
+        Process a single delivery straight into a transformed record dict.
+        Fuses delivery extraction and transform_record_bulk into one pass,
+        skipping the intermediate DeliveryInfo allocation on the hot path.
         Args:
             delivery: Dictionary containing delivery data
             over_number: Number of the over
             ball_number: Number of the ball within the over
             innings_number: Number of the innings
-            batting_team: Team batting in this innings
-            bowling_team: Team bowling in this innings
+            sides: (batting_team, bowling_team) tuple for this innings
+            match_dict: Match information pre-dumped to a dict
+            extras: The delivery's extras dict if the caller already looked it
+                up; None makes this method probe the delivery itself
         Returns:
-            DeliveryInfo object containing delivery information
-        """
-        # Extract basic delivery information
-        runs = delivery["runs"]
-        runs_batter = runs["batter"]
-        runs_extras = runs["extras"]
-        runs_total = runs["total"]
-        # Extract extras information
-        extras_type = None
-        if "extras" in delivery:
-            extras_type = next(iter(delivery["extras"].keys()))
+            Dictionary containing the transformed record
+        """
+        batting_team, bowling_team = sides
+        runs_batter, runs_extras, runs_total = _get_runs_fields(delivery["runs"])
+        if extras is None:
+            extras = delivery.get("extras")
+        # Extras only carry a type when they actually scored extras
+        extras_type = next(iter(extras)) if runs_extras and extras else None
         # Extract wicket information
         wicket_type = None
         wicket_player_out = None
@@ -203,23 +295,34 @@ class CricketParser:
             wicket_player_out = wicket["player_out"]
             if "fielders" in wicket:
                 wicket_fielders = [fielder["name"] for fielder in wicket["fielders"]]
-        return DeliveryInfo(
-            innings_number=innings_number,
-            batting_team=batting_team,
-            bowling_team=bowling_team,
-            over_number=over_number,
-            ball_number=ball_number,
-            batter=delivery["batter"],
-            non_striker=delivery["non_striker"],
-            bowler=delivery["bowler"],
-            runs_batter=runs_batter,
-            runs_extras=runs_extras,
-            runs_total=runs_total,
-            extras_type=extras_type,
-            wicket_type=wicket_type,
-            wicket_player_out=wicket_player_out,
-            wicket_fielders=wicket_fielders
-        )
+        if __debug__:
+            assert runs_total == runs_batter + runs_extras
+        batter, non_striker, bowler = _get_delivery_fields(delivery)
+        # Player names repeat across most deliveries in a match; interning
+        # dedupes the string objects for downstream columnar ingestion.
+        batter = sys.intern(batter)
+        non_striker = sys.intern(non_striker)
+        bowler = sys.intern(bowler)
+        # Single dict display: one allocation sized up front, instead of a
+        # copy followed by an update that rehashes into it.
+        return {
+            **match_dict,
+            "innings_number": innings_number,
+            "batting_team": batting_team,
+            "bowling_team": bowling_team,
+            "over_number": over_number,
+            "ball_number": ball_number,
+            "batter": batter,
+            "non_striker": non_striker,
+            "bowler": bowler,
+            "runs_batter": runs_batter,
+            "runs_extras": runs_extras,
+            "runs_total": runs_total,
+            "extras_type": extras_type,
+            "wicket_type": wicket_type,
+            "wicket_player_out": wicket_player_out,
+            "wicket_fielders": wicket_fielders,
+        }
 
     def write_output(self, data: Dict[str, Any], output_path: Union[str, Path]) -> None:
         """
@@ -227,9 +330,14 @@ class CricketParser:
         Args:
             data: Dictionary containing match data
             output_path: Path to write the output file
+        Raises:
+            ValueError: If data is not a cricket match document
         """
-        records = self._parse_data(data)
-        self.output_generator.write_output(records, output_path)
+        # Reject malformed input up front rather than part-way through a write
+        if not isinstance(data, Mapping) or "info" not in data or "innings" not in data:
+            raise ValueError("invalid cricket data: expected a mapping with 'info' and 'innings'")
+        # Stream records straight into the JSONL writer; no intermediate list.
+        self.output_generator.write_output(self._iter_data(data), output_path)
 
     def process_batch(self, input_files: List[Union[str, Path]], output_path: Union[str, Path]) -> None:
         """
@@ -238,9 +346,7 @@ class CricketParser:
             input_files: List of input file paths
             output_path: Path to write the combined output file
         """
-        all_records = []
-        for input_file in input_files:
-            with open(input_file) as f:
-                data = json.load(f)
-            all_records.extend(self._parse_data(data))
-        self.output_generator.write_output(all_records, output_path) 
\ No newline at end of file
+        # Chain the per-file generators so records stream straight into the
+        # JSONL writer; only one file's document is resident at a time.
+        records = itertools.chain.from_iterable(map(self._iter_file, input_files))
+        self.output_generator.write_output(records, output_path) 
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Dict, Any, List
 from datetime import datetime
+import msgspec
 from .models import MatchInfo, DeliveryInfo
 
 class CricketDataTransformer:
@@ -18,17 +19,57 @@ class CricketDataTransformer:
         Returns:
             Dictionary containing transformed record
         Raises:
-            ValueError: If required fields are missing
-            AssertionError: If data types or constraints are violated
+            AssertionError: If the runs invariant is violated (debug builds only)
         """
         # Convert match info to dictionary and remove balls_per_over
-        record = match_info.model_dump()
-        record.pop('balls_per_over', None)  # Remove balls_per_over field
+        match_dict = msgspec.structs.asdict(match_info)
+        match_dict.pop('balls_per_over', None)  # Remove balls_per_over field
+        return CricketDataTransformer.transform_record_bulk(match_dict, delivery_info)
+
+    @staticmethod
+    def transform_record_bulk(match_dict: Dict[str, Any], delivery_info: DeliveryInfo) -> Dict[str, Any]:
+        """
+        Transform a single delivery record from a precomputed match dict.
+        The match dict is invariant across a match, so callers processing many
+        deliveries should dump it once and pass it here for every delivery.
+        Args:
+            match_dict: Match information already dumped to a dict (without balls_per_over)
+            delivery_info: DeliveryInfo object containing delivery information
+        Returns:
+            Dictionary containing transformed record
+        Raises:
+            AssertionError: If the runs invariant is violated (debug builds only)
+        """
+        # Merge match and delivery fields in a single dict display; one
+        # allocation instead of a copy followed by an update.
+        record = {**match_dict, **msgspec.structs.asdict(delivery_info)}
+
+        # Fields come straight from typed MatchInfo/DeliveryInfo structs, so
+        # only keep the semantic runs invariant; python -O elides it.
+        if __debug__:
+            assert record["runs_total"] == record["runs_batter"] + record["runs_extras"]
+
+        # Handle optional fields
+        if record["runs_extras"] == 0:
+            record["extras_type"] = None
         
-        # Add delivery info
-        record.update(delivery_info.model_dump())
+        if record["wicket_type"] is None:
+            record["wicket_player_out"] = None
+            record["wicket_fielders"] = []
         
-        # Ensure all required fields are present
+        return record
+
+    @staticmethod
+    def validate_record(record: Dict[str, Any]) -> None:
+        """
+        Validate the structure and invariants of a transformed record.
+        Not called on the hot path; intended for tests and boundary checks.
+        Args:
+            record: Dictionary containing a transformed record
+        Raises:
+            ValueError: If required fields are missing
+            AssertionError: If data types or constraints are violated
+        """
         required_fields = {
             "match_date", "match_type", "venue", "city", "teams",
             "innings_number", "batting_team", "bowling_team",
@@ -36,12 +77,12 @@ class CricketDataTransformer:
             "bowler", "runs_batter", "runs_extras", "runs_total",
             "gender", "event"
         }
-        
+
         # Validate required fields
         missing_fields = required_fields - set(record.keys())
         if missing_fields:
             raise ValueError(f"Missing required fields: {missing_fields}")
-        
+
         # Validate data types
         assert isinstance(record["match_date"], str)
         assert isinstance(record["match_type"], str)
@@ -61,23 +102,13 @@ class CricketDataTransformer:
         assert isinstance(record["runs_total"], int)
         assert isinstance(record["gender"], str)
         assert isinstance(record["event"], dict)
-        
+
         # Validate field values
         assert record["gender"] in ["men", "women"], "Gender must be either 'men' or 'women'"
         assert record["runs_total"] == record["runs_batter"] + record["runs_extras"]
         assert record["over_number"] >= 0
         assert 1 <= record["ball_number"] <= 6  # Hardcode 6 balls per over
         assert record["innings_number"] >= 1
-        
-        # Handle optional fields
-        if record["runs_extras"] == 0:
-            record["extras_type"] = None
-        
-        if record["wicket_type"] is None:
-            record["wicket_player_out"] = None
-            record["wicket_fielders"] = []
-        
-        return record
 
     def test_json_output_format(self, output_data: List[Dict[str, Any]]) -> None:
         """
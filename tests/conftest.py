@@ -1,5 +1,58 @@
 import sys
 import os
+import shutil
+from pathlib import Path
+from types import MappingProxyType
+
+import orjson
+import pytest
 
 # Add the src directory to the Python path for all tests
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))) 
\ No newline at end of file
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from cricket_parser.parser import CricketParser
+
+# Resolved once at import; the fixture body then does a single read
+SAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "src" / "conf" / "sample_data.json"
+
+# Built once at collection time; CricketParser is stateless so one instance
+# can back the whole suite
+_PARSER = CricketParser()
+
+@pytest.fixture(scope="session")
+def parser():
+    """Return the single parser instance shared across the session."""
+    return _PARSER
+
+@pytest.fixture(scope="session")
+def parsed_sample(parser, sample_data):
+    """Parse the sample match once and share the records across tests.
+
+    Tests must treat the returned list as read-only; deep-copy in the rare
+    test that needs to mutate records.
+    """
+    return parser._parse_data(sample_data)
+
+@pytest.fixture(scope="session")
+def sample_data():
+    """Load sample cricket match data once for the whole session."""
+    data = orjson.loads(SAMPLE_DATA_PATH.read_bytes())
+    # Read-only view so one test cannot mutate what another sees
+    return MappingProxyType(data)
+
+@pytest.fixture(scope="session")
+def batch_input_files(tmp_path_factory, sample_data):
+    """Write the three identical batch input files once for the session."""
+    batch_dir = tmp_path_factory.mktemp("batch_in")
+    file0 = batch_dir / "match_0.json"
+    # orjson.dumps rejects the read-only mapping view, so copy it
+    file0.write_bytes(orjson.dumps(dict(sample_data)))
+    paths = [file0]
+    for i in (1, 2):
+        path = batch_dir / f"match_{i}.json"
+        try:
+            os.link(file0, path)
+        except OSError:  # hardlinks unavailable (e.g. some Windows setups)
+            shutil.copyfile(file0, path)
+        paths.append(path)
+    return [str(path) for path in paths]
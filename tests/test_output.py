@@ -1,98 +1,90 @@
 import json
-import os
+import orjson
 import pytest
-from pathlib import Path
-import tempfile
-from cricket_parser.parser import CricketParser
 from cricket_parser.output import OutputGenerator
 
-@pytest.fixture
-def sample_data():
-    """Load sample cricket match data for testing."""
-    data_path = Path(__file__).parent.parent / "src" / "conf" / "sample_data.json"
-    with open(data_path) as f:
-        return json.load(f)
+def test_json_output_format(parser, sample_data, tmp_path):
+    """Test that output is generated in correct JSONL format."""
+    output_path = tmp_path / "output.jsonl"
+    parser.write_output(sample_data, str(output_path))
 
-@pytest.fixture
-def parser():
-    """Create a parser instance for testing."""
-    return CricketParser()
+    # Read back once as bytes and validate each line with orjson
+    raw = output_path.read_bytes()
+    records = [orjson.loads(line) for line in raw.split(b'\n') if line]
 
-def test_json_output_format(parser, sample_data):
-    """Test that output is generated in correct JSONL format."""
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.jsonl') as temp_file:
-        # Write output to temporary file
-        parser.write_output(sample_data, temp_file.name)
-        
-        # Read back and validate
-        with open(temp_file.name) as f:
-            lines = f.readlines()
-        
-        # Check that each line is a valid JSON object
-        assert len(lines) > 0
-        for line in lines:
-            line = line.strip()
-            if line:  # Skip empty lines
-                record = json.loads(line)
-                assert isinstance(record, dict)
-                assert all((v is None) or isinstance(v, (str, int, list)) for v in record.values())
+    # Check that each line is a valid JSON object
+    assert len(records) > 0
+    for record in records:
+        assert isinstance(record, dict)
+        # Same value types validate_record allows; event is a dict
+        assert all((v is None) or isinstance(v, (str, int, list, dict)) for v in record.values())
 
-def test_file_writing(parser, sample_data):
+def test_file_writing(parser, sample_data, tmp_path):
     """Test that files are written correctly in JSONL format."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        output_path = Path(temp_dir) / "output.jsonl"
-        
-        # Write output
-        parser.write_output(sample_data, str(output_path))
-        
-        # Check file exists and is readable
-        assert output_path.exists()
-        assert output_path.is_file()
-        
-        # Check file content
-        with open(output_path) as f:
-            lines = f.readlines()
-        assert len(lines) > 0
-        for line in lines:
+    output_path = tmp_path / "output.jsonl"
+
+    # Write output
+    parser.write_output(sample_data, str(output_path))
+
+    # Check file exists and is readable
+    assert output_path.exists()
+    assert output_path.is_file()
+
+    # Check file content, streaming line by line so only one line is
+    # ever resident instead of a list of the whole file
+    count = 0
+    with open(output_path) as f:
+        for line in f:
             line = line.strip()
             if line:  # Skip empty lines
                 assert json.loads(line)  # Verify each line is valid JSON
+                count += 1
+    assert count > 0
+
+def test_jsonl_round_trip(parser, sample_data, tmp_path):
+    """Test that JSONL output is newline-terminated and reloads via _load_file."""
+    output_path = tmp_path / "round_trip.jsonl"
+    records = parser._parse_data(sample_data)
+    output_gen = OutputGenerator()
+    output_gen.write_output(records, str(output_path))
+
+    raw = output_path.read_bytes()
+    assert raw.endswith(b'\n')
+    lines = [line for line in raw.split(b'\n') if line]
+    assert len(lines) == len(records)
 
-def test_batch_processing(parser, sample_data):
+    # Reloading the file should reproduce the records exactly
+    reloaded = output_gen._load_file(str(output_path))
+    assert reloaded == records
+
+def test_batch_processing(parser, batch_input_files, tmp_path):
     """Test batch processing of multiple files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create multiple input files
-        input_files = []
-        for i in range(3):
-            file_path = Path(temp_dir) / f"match_{i}.json"
-            with open(file_path, 'w') as f:
-                json.dump(sample_data, f)
-            input_files.append(file_path)
-        
-        # Process all files
-        output_path = Path(temp_dir) / "batch_output.jsonl"
-        parser.process_batch([str(f) for f in input_files], str(output_path))
-        
-        # Check output
-        assert output_path.exists()
-        with open(output_path) as f:
-            lines = f.readlines()
-        assert len(lines) > 0
-        for line in lines:
+    # Process all files; the inputs are created once per session
+    output_path = tmp_path / "batch_output.jsonl"
+    parser.process_batch(batch_input_files, str(output_path))
+
+    # Check output, streaming line by line so only one line is ever
+    # resident instead of a list of the whole file
+    assert output_path.exists()
+    count = 0
+    with open(output_path) as f:
+        for line in f:
             line = line.strip()
             if line:  # Skip empty lines
                 assert json.loads(line)  # Verify each line is valid JSON
+                count += 1
+    assert count > 0
 
-def test_error_handling(parser, sample_data):
+def test_error_handling(parser, sample_data, tmp_path):
     """Test error handling during output generation."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Test invalid output path
-        invalid_path = Path(temp_dir) / "nonexistent" / "output.jsonl"
-        with pytest.raises(Exception):
-            parser.write_output(sample_data, str(invalid_path))
-        
-        # Test invalid input data
-        invalid_data = {"invalid": "data"}
-        output_path = Path(temp_dir) / "output.jsonl"
-        with pytest.raises(Exception):
-            parser.write_output(invalid_data, str(output_path)) 
\ No newline at end of file
+    # Test invalid output path
+    invalid_path = tmp_path / "nonexistent" / "output.jsonl"
+    with pytest.raises(Exception):
+        parser.write_output(sample_data, str(invalid_path))
+
+    # Test invalid input data; rejected before any parsing or writing
+    invalid_data = {"invalid": "data"}
+    output_path = tmp_path / "output.jsonl"
+    with pytest.raises(ValueError, match="invalid cricket data"):
+        parser.write_output(invalid_data, str(output_path))
+    assert not output_path.exists()
\ No newline at end of file
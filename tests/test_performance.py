@@ -1,35 +1,31 @@
-import pytest
+import gc
 import time
-import json
-from pathlib import Path
-from cricket_parser.parser import CricketParser
 import tracemalloc
 
-@pytest.fixture
-def sample_data():
-    data_path = Path(__file__).parent.parent / "src" / "conf" / "sample_data.json"
-    with open(data_path) as f:
-        return json.load(f)
-
-@pytest.fixture
-def parser():
-    return CricketParser()
-
 def test_parsing_speed(parser, sample_data):
     """Test that parsing is reasonably fast for a typical match file."""
-    start = time.time()
+    start = time.perf_counter_ns()
     result = parser._parse_data(sample_data)
-    end = time.time()
+    elapsed_ms = (time.perf_counter_ns() - start) / 1e6
     assert len(result) > 0
     # Should parse in under 1 second for a single match file
-    assert (end - start) < 1.0
+    assert elapsed_ms < 1000
 
 def test_memory_usage(parser, sample_data):
     """Test that memory usage is reasonable for a typical match file."""
+    # Collect leftovers from earlier tests, then keep the collector out of
+    # the traced region so the peak reflects this parse alone
+    gc.collect()
+    gc.disable()
     tracemalloc.start()
-    result = parser._parse_data(sample_data)
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    try:
+        result = parser._parse_data(sample_data)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        # Re-enable even if the parse raises, or the collector would stay
+        # off for the rest of the session
+        tracemalloc.stop()
+        gc.enable()
     assert len(result) > 0
     # Should not use more than 10MB for a single match file
     assert peak < 10 * 1024 * 1024
@@ -37,17 +33,24 @@ def test_memory_usage(parser, sample_data):
 def test_large_file_handling(tmp_path, parser, sample_data):
     """Test that parser can handle a large file (simulated by duplicating data)."""
     # Simulate a large file by duplicating innings
-    large_data = sample_data.copy()
-    large_data["innings"] = sample_data["innings"] * 50  # 100 innings
-    start = time.time()
-    result = parser._parse_data(large_data)
-    end = time.time()
+    large_data = {**sample_data, "innings": sample_data["innings"] * 50}  # 100 innings
+    # Time and trace the same parse so the 100 innings are only walked once,
+    # with the collector quiesced as in test_memory_usage
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter_ns()
+        result = parser._parse_data(large_data)
+        elapsed_ms = (time.perf_counter_ns() - start) / 1e6
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        # Re-enable even if the parse raises, or the collector would stay
+        # off for the rest of the session
+        tracemalloc.stop()
+        gc.enable()
     assert len(result) > 0
     # Should parse in under 10 seconds for a large file
-    assert (end - start) < 10.0
+    assert elapsed_ms < 10000
     # Should not use more than 100MB for a large file
-    tracemalloc.start()
-    parser._parse_data(large_data)
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
     assert peak < 100 * 1024 * 1024 
\ No newline at end of file
@@ -1,21 +1,33 @@
 import pytest
-from pathlib import Path
-import json
-from cricket_parser.parser import CricketParser
 from cricket_parser.transformer import CricketDataTransformer
 from cricket_parser.models import MatchInfo, DeliveryInfo
 
-@pytest.fixture
-def sample_data():
-    """Load sample cricket match data for testing."""
-    data_path = Path(__file__).parent.parent / "src" / "conf" / "sample_data.json"
-    with open(data_path) as f:
-        return json.load(f)
+# Field -> expected type for every parsed record; one table drives a single
+# pass over the shared parsed result instead of four separate traversals.
+REQUIRED_TYPES = {
+    "match_date": str,
+    "match_type": str,
+    "venue": str,
+    "city": str,
+    "teams": list,
+    "innings_number": int,
+    "batting_team": str,
+    "bowling_team": str,
+    "over_number": int,
+    "ball_number": int,
+    "batter": str,
+    "non_striker": str,
+    "bowler": str,
+    "runs_batter": int,
+    "runs_extras": int,
+    "runs_total": int,
+}
 
-@pytest.fixture
-def parser():
-    """Create a parser instance for testing."""
-    return CricketParser()
+# Frozen at module scope; issubset runs the membership loop in C
+REQUIRED_FIELDS = frozenset(REQUIRED_TYPES) | {"gender", "event"}
+
+# Full per-field type table for transformed records
+RECORD_TYPES = {**REQUIRED_TYPES, "gender": str, "event": dict}
 
 @pytest.fixture
 def sample_match_info():
@@ -56,99 +68,33 @@ def sample_delivery_info():
         runs_total=4
     )
 
-def test_record_generation(parser, sample_data):
-    """Test that records are generated correctly."""
-    result = parser._parse_data(sample_data)
-    assert len(result) > 0
-    
-    # Check that each record has all required fields
-    required_fields = {
-        "match_date", "match_type", "venue", "city", "teams",
-        "innings_number", "batting_team", "bowling_team",
-        "over_number", "ball_number", "batter", "non_striker",
-        "bowler", "runs_batter", "runs_extras", "runs_total"
-    }
-    
-    for record in result:
-        assert all(field in record for field in required_fields)
-
-def test_field_mapping(parser, sample_data):
-    """Test that fields are mapped correctly to Druid schema."""
-    result = parser._parse_data(sample_data)
-    assert len(result) > 0
-    
-    # Check that all fields have appropriate types
-    for record in result:
-        assert isinstance(record["match_date"], str)
-        assert isinstance(record["match_type"], str)
-        assert isinstance(record["venue"], str)
-        assert isinstance(record["city"], str)
-        assert isinstance(record["teams"], list)
-        assert isinstance(record["innings_number"], int)
-        assert isinstance(record["batting_team"], str)
-        assert isinstance(record["bowling_team"], str)
-        assert isinstance(record["over_number"], int)
-        assert isinstance(record["ball_number"], int)
-        assert isinstance(record["batter"], str)
-        assert isinstance(record["non_striker"], str)
-        assert isinstance(record["bowler"], str)
-        assert isinstance(record["runs_batter"], int)
-        assert isinstance(record["runs_extras"], int)
-        assert isinstance(record["runs_total"], int)
-
-def test_data_type_conversion(parser, sample_data):
-    """Test that data types are converted correctly."""
-    result = parser._parse_data(sample_data)
-    assert len(result) > 0
-    
-    # Check numeric fields
-    for record in result:
+def test_parsed_record_invariants(parsed_sample):
+    """Single pass over parsed records checking fields, types, and value invariants."""
+    assert len(parsed_sample) > 0
+    for record in parsed_sample:
+        # Field presence and type (record[field] raises KeyError if missing)
+        for field, expected_type in REQUIRED_TYPES.items():
+            assert isinstance(record[field], expected_type)
+        # Numeric invariants
         assert record["runs_total"] == record["runs_batter"] + record["runs_extras"]
         assert record["over_number"] >= 0
         assert 1 <= record["ball_number"] <= 6
         assert record["innings_number"] in {1, 2}
-
-def test_null_handling(parser, sample_data):
-    """Test that null values are handled correctly."""
-    result = parser._parse_data(sample_data)
-    assert len(result) > 0
-    
-    # Check optional fields
-    for record in result:
         # Optional fields should be None if not present
         if record["runs_extras"] == 0:
             assert record["extras_type"] is None
-        
-        if "wicket_type" in record:
-            if record["wicket_type"] is None:
-                assert record["wicket_player_out"] is None
-                assert record["wicket_fielders"] == []
+        if record["wicket_type"] is None:
+            assert record["wicket_player_out"] is None
+            assert record["wicket_fielders"] == []
 
 def test_record_generation(sample_match_info, sample_delivery_info):
     """Test that records are generated correctly with all required fields."""
     transformer = CricketDataTransformer()
     record = transformer.transform_record(sample_match_info, sample_delivery_info)
     
-    # Check required fields
-    assert "match_date" in record
-    assert "match_type" in record
-    assert "venue" in record
-    assert "city" in record
-    assert "teams" in record
-    assert "innings_number" in record
-    assert "batting_team" in record
-    assert "bowling_team" in record
-    assert "over_number" in record
-    assert "ball_number" in record
-    assert "batter" in record
-    assert "non_striker" in record
-    assert "bowler" in record
-    assert "runs_batter" in record
-    assert "runs_extras" in record
-    assert "runs_total" in record
-    assert "gender" in record
-    assert "event" in record
-    
+    # Check required fields in one shot
+    assert REQUIRED_FIELDS.issubset(record)
+
     # Check values
     assert record["gender"] == "men"
     assert isinstance(record["event"], dict)
@@ -156,6 +102,24 @@ def test_record_generation(sample_match_info, sample_delivery_info):
     assert record["event"]["type"] == "bilateral"
     assert record["event"]["season"] == "2024"
 
+def test_record_validation(sample_match_info, sample_delivery_info):
+    """Test that validate_record accepts a transformed record and rejects incomplete ones."""
+    transformer = CricketDataTransformer()
+    record = transformer.transform_record(sample_match_info, sample_delivery_info)
+
+    # A freshly transformed record passes structural validation
+    transformer.validate_record(record)
+
+    # Value constraints are enforced, not just field presence
+    bad_gender = {**record, "gender": "unknown"}
+    with pytest.raises(AssertionError):
+        transformer.validate_record(bad_gender)
+
+    # Missing required fields raise ValueError naming the gap
+    incomplete = {key: value for key, value in record.items() if key != "bowler"}
+    with pytest.raises(ValueError, match="bowler"):
+        transformer.validate_record(incomplete)
+
 def test_field_mapping(sample_match_info, sample_delivery_info):
     """Test that fields are mapped correctly from input to output."""
     transformer = CricketDataTransformer()
@@ -186,25 +150,9 @@ def test_data_type_conversion(sample_match_info, sample_delivery_info):
     transformer = CricketDataTransformer()
     record = transformer.transform_record(sample_match_info, sample_delivery_info)
     
-    # Check data types
-    assert isinstance(record["match_date"], str)
-    assert isinstance(record["match_type"], str)
-    assert isinstance(record["venue"], str)
-    assert isinstance(record["city"], str)
-    assert isinstance(record["teams"], list)
-    assert isinstance(record["innings_number"], int)
-    assert isinstance(record["batting_team"], str)
-    assert isinstance(record["bowling_team"], str)
-    assert isinstance(record["over_number"], int)
-    assert isinstance(record["ball_number"], int)
-    assert isinstance(record["batter"], str)
-    assert isinstance(record["non_striker"], str)
-    assert isinstance(record["bowler"], str)
-    assert isinstance(record["runs_batter"], int)
-    assert isinstance(record["runs_extras"], int)
-    assert isinstance(record["runs_total"], int)
-    assert isinstance(record["gender"], str)
-    assert isinstance(record["event"], dict)
+    # Check data types from the shared table
+    for field, expected_type in RECORD_TYPES.items():
+        assert isinstance(record[field], expected_type)
 
 def test_null_handling(sample_match_info, sample_delivery_info):
     """Test handling of null/optional fields."""